@@ -12,7 +12,7 @@ Markup = (
 EnterCallback = Callable[[int, int, dict[str, Any]], Awaitable[types.Message]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class FormFieldInfo:
     enter_message_text: str | None
     error_message_text: str | None
@@ -21,7 +21,7 @@ class FormFieldInfo:
     enter_callback: EnterCallback | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class FormFieldData:
     name: str
     type: Type
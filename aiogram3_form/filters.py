@@ -1,8 +1,9 @@
 import datetime
-from dataclasses import dataclass
-from typing import Any, Callable, Coroutine, Protocol, Type
+import types as _types
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Mapping, Protocol, Type
 
-from aiogram import F, types
+from aiogram import types
 from aiogram.utils.magic_filter import MagicFilter
 
 from . import utils
@@ -10,23 +11,88 @@ from . import utils
 FormFilter = MagicFilter | Callable[..., Any]
 InputTransformResult = tuple[Any, bool]
 
-DEFAULT_FORM_FILTERS: dict[Type, FormFilter] = {
-    str: F.text,
-    int: F.text.func(int),
-    float: F.text.func(float),
-    datetime.date: F.text.func(
-        lambda text: datetime.datetime.strptime(text, r"%d.%m.%Y").date()
-    ),
-    datetime.datetime: F.text.func(
-        lambda text: datetime.datetime.strptime(text, r"%d.%m.%Y %H:%M")
-    ),
-    datetime.time: F.text.func(
-        lambda text: datetime.datetime.strptime(text, r"%H:%M").time()
-    ),
-    types.PhotoSize: F.photo.func(lambda photo: photo[-1]),
-    types.Document: F.document.func(lambda document: document),
-    types.Message: F.func(lambda m: m),
-}
+
+def _text_filter(message: types.Message):
+    return message.text if message.text is not None else False
+
+
+def _int_filter(message: types.Message):
+    if message.text is None:
+        return False
+
+    try:
+        return int(message.text)
+    except ValueError:
+        return False
+
+
+def _float_filter(message: types.Message):
+    if message.text is None:
+        return False
+
+    try:
+        return float(message.text)
+    except ValueError:
+        return False
+
+
+def _date_filter(message: types.Message):
+    if message.text is None:
+        return False
+
+    try:
+        return datetime.datetime.strptime(message.text, r"%d.%m.%Y").date()
+    except ValueError:
+        return False
+
+
+def _datetime_filter(message: types.Message):
+    if message.text is None:
+        return False
+
+    try:
+        return datetime.datetime.strptime(message.text, r"%d.%m.%Y %H:%M")
+    except ValueError:
+        return False
+
+
+def _time_filter(message: types.Message):
+    if message.text is None:
+        return False
+
+    try:
+        return datetime.datetime.strptime(message.text, r"%H:%M").time()
+    except ValueError:
+        return False
+
+
+def _photo_filter(message: types.Message):
+    return message.photo[-1] if message.photo else False
+
+
+def _document_filter(message: types.Message):
+    return message.document if message.document is not None else False
+
+
+def _message_filter(message: types.Message):
+    return message
+
+
+_STR_FILTER: FormFilter = _text_filter
+_INT_FILTER: FormFilter = _int_filter
+_FLOAT_FILTER: FormFilter = _float_filter
+
+DEFAULT_FORM_FILTERS: Mapping[Type, FormFilter] = _types.MappingProxyType({
+    str: _STR_FILTER,
+    int: _INT_FILTER,
+    float: _FLOAT_FILTER,
+    datetime.date: _date_filter,
+    datetime.datetime: _datetime_filter,
+    datetime.time: _time_filter,
+    types.PhotoSize: _photo_filter,
+    types.Document: _document_filter,
+    types.Message: _message_filter,
+})
 
 
 class InputTransformer(Protocol):
@@ -35,14 +101,18 @@ class InputTransformer(Protocol):
     ) -> InputTransformResult: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MagicInputTransformer(InputTransformer):
     filter: MagicFilter
+    _resolve: Callable[[types.Message], Any] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_resolve", self.filter.resolve)
 
     async def transform_input_message(
         self, message: types.Message, data: dict[str, Any]
     ) -> InputTransformResult:
-        filter_result = self.filter.resolve(message)
+        filter_result = self._resolve(message)
 
         if filter_result is None or filter_result is False:
             return filter_result, False
@@ -50,15 +120,20 @@ class MagicInputTransformer(InputTransformer):
         return filter_result, True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncInputTransformer(InputTransformer):
     filter: Callable[..., Any]
+    _accepted_params: frozenset[str] | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_accepted_params", utils.accepted_params(self.filter))
 
     async def transform_input_message(
         self, message: types.Message, data: dict[str, Any]
     ) -> InputTransformResult:
-        prepared_field_filter = utils.prepare_function(self.filter, message, **data)
-        filter_result = prepared_field_filter()
+        filter_result = self.filter(
+            message, **utils.prepare_kwargs(self._accepted_params, data)
+        )
 
         if filter_result is False:
             return filter_result, False
@@ -66,15 +141,20 @@ class SyncInputTransformer(InputTransformer):
         return filter_result, True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AsyncInputTransformer(InputTransformer):
     filter: Callable[..., Coroutine[Any, Any, Any]]
+    _accepted_params: frozenset[str] | None = field(init=False, repr=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_accepted_params", utils.accepted_params(self.filter))
 
     async def transform_input_message(
         self, message: types.Message, data: dict[str, Any]
     ) -> InputTransformResult:
-        prepared_field_filter = utils.prepare_function(self.filter, message, **data)
-        filter_result = await prepared_field_filter()
+        filter_result = await self.filter(
+            message, **utils.prepare_kwargs(self._accepted_params, data)
+        )
 
         if filter_result is False:
             return filter_result, False
@@ -83,11 +163,18 @@ class AsyncInputTransformer(InputTransformer):
 
 
 def get_form_filter_for_type(field_type: Type) -> FormFilter:
-    field_filter = DEFAULT_FORM_FILTERS.get(field_type)
+    if field_type is str:
+        return _STR_FILTER
 
-    if field_filter is None:
+    if field_type is int:
+        return _INT_FILTER
+
+    if field_type is float:
+        return _FLOAT_FILTER
+
+    try:
+        return DEFAULT_FORM_FILTERS[field_type]
+    except KeyError:
         raise TypeError(
             f"There is no default filter for type {field_type}. You should consider writing your own filter"  # noqa: E501
-        )
-
-    return field_filter
+        ) from None
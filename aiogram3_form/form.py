@@ -1,5 +1,6 @@
+import asyncio
 import inspect
-from abc import ABC, ABCMeta
+import weakref
 from typing import Any, Callable, Coroutine, Generator, NamedTuple, TypedDict
 
 from aiogram import Bot, types
@@ -15,11 +16,11 @@ SubmitCallback = Callable[..., Any]
 Markup = types.ReplyKeyboardMarkup | types.InlineKeyboardMarkup
 
 
-def _form_fields_data_generator(cls: "FormMeta") -> Generator[FormFieldData, Any, None]:
-    annotations = inspect.get_annotations(cls)
+def _form_fields_data_generator(cls_dict: dict) -> Generator[FormFieldData, Any, None]:
+    annotations = cls_dict.get("__annotations__", {})
 
     for field_name, field_type in annotations.items():
-        field_info = getattr(cls, field_name, None)
+        field_info = cls_dict.get(field_name)
 
         if not isinstance(field_info, FormFieldInfo):
             continue
@@ -33,7 +34,7 @@ def _form_fields_data_generator(cls: "FormMeta") -> Generator[FormFieldData, Any
             transformer = filters.MagicInputTransformer(field_filter)
         elif inspect.iscoroutinefunction(field_filter):
             transformer = filters.AsyncInputTransformer(field_filter)
-        elif inspect.isfunction(field_filter):
+        elif callable(field_filter):
             transformer = filters.SyncInputTransformer(field_filter)
         else:
             raise TypeError(
@@ -45,23 +46,42 @@ def _form_fields_data_generator(cls: "FormMeta") -> Generator[FormFieldData, Any
         )
 
 
-class FormStateData(TypedDict):
-    __form_name: str
-    __current_field_index: int
-    __form_values: dict[str, Any]
+# short keys keep the serialized FSM payload small for remote storages
+_KEY_FIELD_INDEX = "_i"
+_KEY_VALUES = "_v"
 
+FormStateData = TypedDict(
+    "FormStateData",
+    {
+        "_i": int,
+        "_v": dict[str, Any],
+    },
+)
 
-class FormMeta(ABCMeta):
-    __form_cls_names: set[str] = set()
+
+class FormMeta(type):
+    __form_registry: "weakref.WeakValueDictionary[str, FormMeta]" = (
+        weakref.WeakValueDictionary()
+    )
 
     def __new__(cls, cls_name: str, parents: tuple, cls_dict: dict):
-        if cls_name in cls.__form_cls_names:
+        if cls_name in cls.__form_registry:
             raise NameError("Form with the same name does exist")
 
-        cls.__form_cls_names.add(cls_name)
+        form_fields = tuple(_form_fields_data_generator(cls_dict))
+
+        # the infos are captured in form_fields; removing them from the class
+        # body frees the names to become slots for the field values
+        for field in form_fields:
+            del cls_dict[field.name]
+
+        cls_dict.setdefault("__slots__", tuple(field.name for field in form_fields))
+        cls_dict["fields"] = form_fields
+        cls_dict["_fields_count"] = len(form_fields)
 
         subcls = super().__new__(cls, cls_name, parents, cls_dict)
-        setattr(subcls, "fields", tuple(_form_fields_data_generator(subcls)))
+
+        cls.__form_registry[cls_name] = subcls
         return subcls
 
 
@@ -70,8 +90,11 @@ class FormSubmitData(NamedTuple):
     clear_state: bool
 
 
-class Form(ABC, metaclass=FormMeta):
+class Form(metaclass=FormMeta):
+    __slots__ = ("bot", "chat_id")
+
     fields: tuple[FormFieldData, ...]
+    _fields_count: int
 
     __submit_data: FormSubmitData = None  # type: ignore
     # this should be set by the user via .submit()
@@ -104,16 +127,18 @@ class Form(ABC, metaclass=FormMeta):
     async def start(cls, bot: Bot, state_ctx: FSMContext, **data: Any) -> types.Message:
         first_field = cls.fields[0]
 
-        await state_ctx.set_state(cls.__name__)
-
         state_data: FormStateData = {
-            "__form_name": cls.__name__,
-            "__form_values": {},
-            "__current_field_index": 0,
+            _KEY_VALUES: {},
+            _KEY_FIELD_INDEX: 0,
         }
 
-        await state_ctx.update_data(
-            state_data,  # type: ignore
+        # independent storage writes, so overlap them; the enter message is
+        # only sent after both complete to avoid racing the user's reply
+        await asyncio.gather(
+            state_ctx.set_state(cls.__name__),
+            state_ctx.update_data(
+                state_data,  # type: ignore
+            ),
         )
 
         if first_field.info.enter_callback:
@@ -130,50 +155,59 @@ class Form(ABC, metaclass=FormMeta):
     @classmethod
     def __create_object(cls, handler_data: dict[str, Any], state_data: FormStateData):
         form_object = cls(handler_data["bot"], handler_data["event_chat"].id)
-        form_object.__dict__.update(state_data["__form_values"])
+
+        for field_name, field_value in state_data[_KEY_VALUES].items():
+            setattr(form_object, field_name, field_value)
+
         return form_object
 
     @classmethod
     async def __resolve_callback(
-        cls, message: types.Message, state: FSMContext, _form_value: Any, **data: Any
+        cls,
+        message: types.Message,
+        state: FSMContext,
+        _form_value: Any,
+        _form_state_data: "FormStateData",
+        **data: Any,
     ):
-        state_data: FormStateData = await state.get_data()  # type: ignore
+        state_data = _form_state_data
+        fields = cls.fields
+        current_field_index = state_data[_KEY_FIELD_INDEX]
 
-        current_field = cls.fields[state_data["__current_field_index"]]
-        state_data["__form_values"][current_field.name] = _form_value
+        current_field = fields[current_field_index]
+        state_data[_KEY_VALUES][current_field.name] = _form_value
 
-        try:
-            next_field_index = state_data["__current_field_index"] + 1
-            next_field = cls.fields[next_field_index]
-            state_data["__current_field_index"] = next_field_index
+        next_field_index = current_field_index + 1
+
+        if next_field_index < cls._fields_count:
+            next_field_info = fields[next_field_index].info
+            state_data[_KEY_FIELD_INDEX] = next_field_index
 
             await state.set_data(
                 state_data,  # type: ignore
             )
 
-            if next_field.info.enter_callback:
-                return await next_field.info.enter_callback(
-                    state.key.chat_id, state.key.user_id, data | state_data
+            if next_field_info.enter_callback:
+                # data is this handler's private kwargs dict, so updating it
+                # in place spares the copy a | merge would allocate
+                data.update(state_data)
+                return await next_field_info.enter_callback(
+                    state.key.chat_id, state.key.user_id, data
                 )
 
             return await message.answer(
-                next_field.info.enter_message_text,  # type: ignore
-                reply_markup=next_field.info.reply_markup,
+                next_field_info.enter_message_text,  # type: ignore
+                reply_markup=next_field_info.reply_markup,
             )
-        except IndexError:
-            pass  # submit reached
 
+        # submit reached: state_data is handed over in memory, no write-back
         if cls.__submit_data.clear_state:
             await state.set_state(None)
 
         form_object = cls.__create_object(data, state_data)
         data["state"] = state
 
-        prepared_submit_callback = utils.prepare_function(
-            cls.__submit_data.callback, form_object, **data
-        )
-
-        await prepared_submit_callback()
+        await utils.call_prepared(cls.__submit_data.callback, form_object, **data)
 
     @classmethod
     async def __current_field_filter(
@@ -182,21 +216,22 @@ class Form(ABC, metaclass=FormMeta):
         state: FSMContext = data["state"]
         state_data: FormStateData = await state.get_data()  # type: ignore
 
-        if state_data["__form_name"] != cls.__name__:
-            return False
-
-        current_field = cls.fields[state_data["__current_field_index"]]
+        # no form name check needed: the handler is registered behind
+        # StateFilter(cls.__name__) and form names are unique
+        current_field = cls.fields[state_data[_KEY_FIELD_INDEX]]
         filter_result, success = (
             await current_field.transformer.transform_input_message(message, data)
         )
 
         if success:
-            return dict(_form_value=filter_result)
+            return {"_form_value": filter_result, "_form_state_data": state_data}
+
+        current_field_info = current_field.info
 
-        if current_field.info.error_message_text:
+        if current_field_info.error_message_text:
             await message.answer(
-                current_field.info.error_message_text,
-                reply_markup=current_field.info.reply_markup,
+                current_field_info.error_message_text,
+                reply_markup=current_field_info.reply_markup,
             )
 
         return False
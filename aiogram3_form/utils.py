@@ -3,14 +3,32 @@ import inspect
 from typing import Callable
 
 
-def prepare_function(func: Callable, *args, **kwargs):
-    arg_spec = inspect.getfullargspec(func)
+@functools.lru_cache(maxsize=512)
+def _cached_accepted_params(func: Callable) -> frozenset[str] | None:
+    parameters = inspect.signature(func).parameters.values()
 
-    prepared_kwargs = {
-        k: v
-        for k, v in kwargs.items()
-        if k in arg_spec.args or k in arg_spec.kwonlyargs
-    }
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters):
+        return None
 
-    partial_func = functools.partial(func, *args, **prepared_kwargs)
-    return partial_func
+    return frozenset(
+        p.name for p in parameters if p.kind is not inspect.Parameter.VAR_POSITIONAL
+    )
+
+
+def accepted_params(func: Callable) -> frozenset[str] | None:
+    """Returns the set of keyword names func accepts, None if it takes **kwargs."""
+    try:
+        return _cached_accepted_params(func)
+    except TypeError:  # unhashable callable, can not be cached
+        return _cached_accepted_params.__wrapped__(func)
+
+
+def prepare_kwargs(params: frozenset[str] | None, kwargs: dict) -> dict:
+    if params is None:
+        return kwargs
+
+    return {name: kwargs[name] for name in kwargs.keys() & params}
+
+
+def call_prepared(func: Callable, *args, **kwargs):
+    return func(*args, **prepare_kwargs(accepted_params(func), kwargs))